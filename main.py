@@ -19,18 +19,40 @@ To run locally:
     $ uvicorn main:app --reload
 """
 
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
-from slowapi import Limiter
+from fastapi.responses import ORJSONResponse
 from slowapi.errors import RateLimitExceeded
 from starlette.responses import JSONResponse
 from src.api import utils, contacts, auth, users
+from src.database.db import sessionmanager
+from src.limiter import limiter
+from src.services.email import email_worker
 from fastapi.middleware.cors import CORSMiddleware
 
-# Initialize Limiter
-limiter = Limiter(key_func=lambda request: request.client.host)
 
-#: Main FastAPI application instance.
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan: pre-warm the database pool and run the email
+    queue worker for the life of the app.
+    """
+    try:
+        await sessionmanager.warmup()
+    except Exception as e:
+        # A cold pool is a latency problem, not a startup error — the
+        # first requests will open connections lazily as before.
+        print(f"Database pool warmup failed: {e}")
+    worker = asyncio.create_task(email_worker())
+    yield
+    worker.cancel()
+
+
+#: Main FastAPI application instance. orjson serializes response bodies
+#: straight to bytes, several times faster than stdlib json.
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 #: Allowed origins for CORS.
 origins = ["http://localhost:3000"]
@@ -76,5 +98,9 @@ async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
 if __name__ == "__main__":
     import uvicorn
 
-    #: Run the FastAPI application with autoreload enabled.
-    uvicorn.run("main:app", host="127.0.0.1", port=8000, reload=True)
+    #: Run the FastAPI application with autoreload enabled. Proxy headers
+    #: are trusted so the rate limiter keys on the real client address
+    #: when the app sits behind a reverse proxy.
+    uvicorn.run(
+        "main:app", host="127.0.0.1", port=8000, reload=True, proxy_headers=True
+    )
@@ -0,0 +1,30 @@
+"""add contacts (user_id, id) index
+
+Revision ID: c41d90f3a1be
+Revises: bf3f53b76b03
+Create Date: 2026-08-30 10:12:33.118204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c41d90f3a1be"
+down_revision: Union[str, Sequence[str], None] = "bf3f53b76b03"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_contacts_user_id_id", "contacts", ["user_id", "id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_contacts_user_id_id", table_name="contacts")
@@ -18,21 +18,22 @@ from fastapi import (
     HTTPException,
     Depends,
     status,
-    BackgroundTasks,
     Request,
 )
 from sqlalchemy.orm import Session
 from fastapi.security import OAuth2PasswordRequestForm
+from redis.asyncio import Redis
 from src.schemas import UserCreate, Token, User
 from src.services.auth import (
     create_access_token,
     get_email_from_token,
     create_email_token,
 )
-from src.utils.hash_utility import Hash
+from src.utils.hash_utility import hasher
 from src.services.users import UserService
-from src.database.db import get_db
-from src.services.email import send_email
+from src.repository.users import UserRepository
+from src.database.db import get_db, get_redis
+from src.services.email import enqueue_email, send_email
 from src.schemas import RequestEmail, ForgotPasswordRequest, ResetPasswordRequest
 
 router = APIRouter(prefix="/auth", tags=["auth"])
@@ -41,7 +42,6 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 @router.post("/register", response_model=User, status_code=status.HTTP_201_CREATED)
 async def register_user(
     user_data: UserCreate,
-    background_tasks: BackgroundTasks,
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -49,10 +49,9 @@ async def register_user(
     Register a new user and send a verification email.
 
     Checks for duplicate email or username, hashes the password, creates the user,
-    and schedules a background task to send a confirmation email.
+    and queues a confirmation email for the background worker.
 
     :param user_data: UserCreate schema containing registration data.
-    :param background_tasks: FastAPI BackgroundTasks for sending email asynchronously.
     :param request: FastAPI Request object to get the base URL.
     :param db: Database session dependency.
     :return: The created User object.
@@ -60,24 +59,23 @@ async def register_user(
     """
     user_service = UserService(db)
 
-    email_user = await user_service.get_user_by_email(user_data.email)
-    if email_user:
+    email_exists, username_exists = await user_service.find_conflict(
+        user_data.email, user_data.username
+    )
+    if email_exists:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Користувач з таким email вже існує",
         )
 
-    username_user = await user_service.get_user_by_username(user_data.username)
-    if username_user:
+    if username_exists:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Користувач з таким іменем вже існує",
         )
-    user_data.password = Hash().get_password_hash(user_data.password)
+    user_data.password = await hasher.get_password_hash(user_data.password)
     new_user = await user_service.create_user(user_data)
-    background_tasks.add_task(
-        send_email, new_user.email, new_user.username, request.base_url
-    )
+    await enqueue_email(send_email, new_user.email, new_user.username, request.base_url)
     return new_user
 
 
@@ -96,9 +94,10 @@ async def login_user(
     :return: Dictionary containing access_token and token_type.
     :raises HTTPException: If credentials are invalid or email is not confirmed.
     """
-    user_service = UserService(db)
-    user = await user_service.get_user_by_username(form_data.username)
-    if not user or not Hash().verify_password(form_data.password, user.hashed_password):
+    user = await UserRepository(db).get_user_by_username(form_data.username)
+    if not user or not await hasher.verify_password(
+        form_data.password, user.hashed_password
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Неправильний логін або пароль",
@@ -109,12 +108,18 @@ async def login_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Електронна адреса не підтверджена",
         )
-    access_token = await create_access_token(data={"sub": user.username})
+    access_token = await create_access_token(
+        data={"sub": user.username, "uid": user.id, "role": user.role.value}
+    )
     return {"access_token": access_token, "token_type": "bearer"}
 
 
 @router.get("/confirmed_email/{token}")
-async def confirmed_email(token: str, db: Session = Depends(get_db)):
+async def confirmed_email(
+    token: str,
+    db: Session = Depends(get_db),
+    redis: Redis = Depends(get_redis),
+):
     """
     Confirm a user's email address using a verification token.
 
@@ -123,11 +128,12 @@ async def confirmed_email(token: str, db: Session = Depends(get_db)):
 
     :param token: Email verification JWT token.
     :param db: Database session dependency.
+    :param redis: Redis client used to invalidate the cached user.
     :return: Dictionary with a confirmation message.
     :raises HTTPException: If the token is invalid or verification fails.
     """
     email = await get_email_from_token(token)
-    user_service = UserService(db)
+    user_service = UserService(db, redis)
     user = await user_service.get_user_by_email(email)
     if user is None:
         raise HTTPException(
@@ -142,7 +148,6 @@ async def confirmed_email(token: str, db: Session = Depends(get_db)):
 @router.post("/request_email")
 async def request_email(
     body: RequestEmail,
-    background_tasks: BackgroundTasks,
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -150,16 +155,14 @@ async def request_email(
     Request a new email verification link.
 
     Checks if the user exists and whether the email is already confirmed.
-    If not, schedules a background task to send a new verification email.
+    If not, queues a new verification email for the background worker.
 
     :param body: RequestEmail schema containing the user's email.
-    :param background_tasks: FastAPI BackgroundTasks for sending email asynchronously.
     :param request: FastAPI Request object to get the base URL.
     :param db: Database session dependency.
     :return: Dictionary with a status message.
     """
-    user_service = UserService(db)
-    user = await user_service.get_user_by_email(body.email)
+    user = await UserRepository(db).get_user_by_email(body.email)
 
     if user is None:
         return {"message: Користувача з такою поштою не знайдено"}
@@ -167,16 +170,13 @@ async def request_email(
     if user.confirmed:
         return {"message": "Ваша електронна пошта вже підтверджена"}
     if user:
-        background_tasks.add_task(
-            send_email, user.email, user.username, request.base_url
-        )
+        await enqueue_email(send_email, user.email, user.username, request.base_url)
     return {"message": "Перевірте свою електронну пошту для підтвердження"}
 
 
 @router.post("/forgot-password")
 async def forgot_password(
     body: ForgotPasswordRequest,
-    background_tasks: BackgroundTasks,
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -185,8 +185,7 @@ async def forgot_password(
 
     Sends a reset token to the user's email if the user exists.
     """
-    user_service = UserService(db)
-    user = await user_service.get_user_by_email(body.email)
+    user = await UserRepository(db).get_user_by_email(body.email)
     if not user:
         return {"message": "No user with such an email"}
 
@@ -195,19 +194,23 @@ async def forgot_password(
 
     # Send reset email in background
     reset_link = f"{request.base_url}reset-password?token={token}"
-    background_tasks.add_task(send_email, user.email, user.username, reset_link)
+    await enqueue_email(send_email, user.email, user.username, reset_link)
 
     return {"message": "a reset link has been sent."}
 
 
 @router.post("/reset-password")
-async def reset_password(body: ResetPasswordRequest, db: Session = Depends(get_db)):
+async def reset_password(
+    body: ResetPasswordRequest,
+    db: Session = Depends(get_db),
+    redis: Redis = Depends(get_redis),
+):
     """
     Reset the user's password using a valid reset token.
     """
     email = await get_email_from_token(body.token)
 
-    user_service = UserService(db)
+    user_service = UserService(db, redis)
     updated_user = await user_service.reset_password(email, body.new_password)
 
     if not updated_user:
@@ -14,56 +14,71 @@ Endpoints:
 
 from typing import List
 
-from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi import APIRouter, HTTPException, Depends, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.db import get_db
-from src.schemas import ContactBase, ContactResponse
+from src.schemas import ContactBase, ContactResponse, ContactUpdate, UserPrincipal
 from src.database.models import User
-from src.services.auth import get_current_user
+from src.services.auth import get_current_user, get_current_user_light
 from src.services.contacts import ContactService
+from src.repository.contacts import ContactRepository
 
 router = APIRouter(prefix="/contacts", tags=["contacts"])
 
+#: Single adapter instance for serializing contact lists in one batch
+#: pass instead of FastAPI's per-item response_model validation.
+_CONTACTS_ADAPTER = TypeAdapter(List[ContactResponse])
 
-@router.get("/", response_model=List[ContactResponse])
+
+@router.get("/")
 async def get_contacts(
     skip: int = 0,
     limit: int = 100,
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(get_current_user),
-):
+    user: UserPrincipal = Depends(get_current_user_light),
+) -> List[ContactResponse]:
     """
     Retrieve a list of contacts for the authenticated user.
 
+    The page is serialized in one TypeAdapter batch pass rather than
+    through per-item response_model validation. The total number of
+    matching contacts is exposed via the `X-Total-Count` response header.
+
     :param skip: Number of records to skip (pagination).
     :param limit: Maximum number of records to return.
     :param db: Asynchronous database session.
-    :param user: Currently authenticated user.
+    :param user: Lightweight principal of the authenticated user.
     :return: List of ContactResponse objects.
     """
-    contact_service = ContactService(db)
-    contacts = await contact_service.get_contacts(skip, limit, user=user)
-    return contacts
+    contacts, total = await ContactRepository(db).get_contacts(skip, limit, user=user)
+    body = _CONTACTS_ADAPTER.dump_json(
+        _CONTACTS_ADAPTER.validate_python(contacts, from_attributes=True)
+    )
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"X-Total-Count": str(total)},
+    )
 
 
 @router.get("/{contact_id}", response_model=ContactResponse)
 async def read_contact(
     contact_id: int,
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user_light),
 ):
     """
     Retrieve a single contact by its ID.
 
     :param contact_id: ID of the contact to retrieve.
     :param db: Asynchronous database session.
-    :param user: Currently authenticated user.
+    :param user: Lightweight principal of the authenticated user.
     :return: ContactResponse object.
     :raises HTTPException: 404 if contact not found.
     """
-    contact_service = ContactService(db)
-    contact = await contact_service.get_contact(contact_id, user=user)
+    contact = await ContactRepository(db).get_contact_by_id(contact_id, user=user)
     if contact is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Contact not found"
@@ -91,7 +106,7 @@ async def create_contact(
 
 @router.put("/{contact_id}", response_model=ContactResponse)
 async def update_contact(
-    body: ContactBase,
+    body: ContactUpdate,
     contact_id: int,
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
@@ -99,15 +114,14 @@ async def update_contact(
     """
     Update an existing contact.
 
-    :param body: ContactBase schema with updated contact data.
+    :param body: ContactUpdate schema with the fields to change.
     :param contact_id: ID of the contact to update.
     :param db: Asynchronous database session.
     :param user: Currently authenticated user.
     :return: The updated ContactResponse object.
     :raises HTTPException: 404 if contact not found.
     """
-    contact_service = ContactService(db)
-    contact = await contact_service.update_contact(contact_id, body, user=user)
+    contact = await ContactRepository(db).update_contact(contact_id, body, user=user)
     if contact is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Contact not found"
@@ -130,8 +144,7 @@ async def remove_contact(
     :return: The deleted ContactResponse object.
     :raises HTTPException: 404 if contact not found.
     """
-    contact_service = ContactService(db)
-    contact = await contact_service.remove_contact(contact_id, user=user)
+    contact = await ContactRepository(db).remove_contact(contact_id, user=user)
     if contact is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Contact not found"
@@ -9,18 +9,19 @@ Endpoints:
     PATCH /users/avatar: Update the authenticated user's avatar image.
 """
 
+import asyncio
+
 from fastapi import APIRouter, Request, Depends, File, UploadFile
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.schemas import User
 from src.services.auth import get_current_user
-from slowapi import Limiter
-from src.services.upload_file import UploadFileService
-from src.conf.config import config
-from src.database.db import get_db
+from src.limiter import limiter
+from src.services.upload_file import upload_file_service
+from src.database.db import get_db, get_redis
 from src.services.users import UserService
 
 router = APIRouter(prefix="/users", tags=["users"])
-limiter = Limiter(key_func=lambda request: request.client.host)
 
 
 @router.get(
@@ -43,6 +44,7 @@ async def update_avatar_user(
     file: UploadFile = File(),
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
 ):
     """
     Update the authenticated user's avatar.
@@ -50,13 +52,16 @@ async def update_avatar_user(
     :param file: Uploaded avatar image file.
     :param user: Currently authenticated user, injected via dependency.
     :param db: Asynchronous database session.
+    :param redis: Redis client used to refresh the cached user.
     :return: Updated User object with the new avatar URL.
     """
-    avatar_url = UploadFileService(
-        config.CLD_NAME, config.CLD_API_KEY, config.CLD_API_SECRET
-    ).upload_file(file, user.username)
+    # The Cloudinary upload is a blocking HTTPS POST; run it in a worker
+    # thread so the event loop keeps serving other requests meanwhile.
+    avatar_url = await asyncio.to_thread(
+        upload_file_service.upload_file, file, user.username
+    )
 
-    user_service = UserService(db)
+    user_service = UserService(db, redis)
     user = await user_service.update_avatar_url(user.email, avatar_url)
 
     return user
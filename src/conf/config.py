@@ -24,6 +24,9 @@ class Config:
         f"@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
     )
 
+    # Password hashing
+    BCRYPT_COST: int = int(os.getenv("BCRYPT_COST", 11))
+
     # JWT
     JWT_SECRET: str = os.getenv("JWT_SECRET", "your_secret_key")
     JWT_ALGORITHM: str = os.getenv("JWT_ALGORITHM", "HS256")
@@ -46,8 +49,9 @@ class Config:
     CLD_API_KEY = os.getenv("CLOUDINARY_API_KEY")
     CLD_API_SECRET = os.getenv("CLOUDINARY_API_SECRET")
 
-    REDIS_HOST = os.getenv("REDIS_HOST")
-    REDIS_PORT = os.getenv("REDIS_PORT")
+    REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
+    REDIS_PORT = os.getenv("REDIS_PORT", "6379")
+    REDIS_URL = f"redis://{REDIS_HOST}:{REDIS_PORT}/0"
 
 
 config = Config()
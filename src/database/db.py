@@ -14,11 +14,34 @@ from src.conf.config import config
 
 class DatabaseSessionManager:
     def __init__(self, url: str):
-        self._engine: AsyncEngine | None = create_async_engine(url)
+        self._engine: AsyncEngine | None = create_async_engine(
+            url,
+            pool_size=20,
+            max_overflow=30,
+            pool_timeout=30,
+            pool_recycle=1800,
+            pool_pre_ping=True,
+            pool_use_lifo=True,
+        )
         self._session_maker: async_sessionmaker = async_sessionmaker(
             autoflush=False, autocommit=False, bind=self._engine
         )
 
+    async def warmup(self, connections: int = 5) -> None:
+        """
+        Eagerly open pooled connections at startup.
+
+        The pool creates connections lazily, so without this the first
+        requests each pay the TCP + auth handshake. Holding all the
+        connections open before closing them forces the pool to create
+        distinct ones rather than reusing the first.
+
+        :param connections: Number of connections to pre-create.
+        """
+        conns = [await self._engine.connect() for _ in range(connections)]
+        for conn in conns:
+            await conn.close()
+
     @contextlib.asynccontextmanager
     async def session(self):
         if self._session_maker is None:
@@ -1,5 +1,15 @@
 from datetime import datetime, date
-from sqlalchemy import Integer, Boolean, String, Date, DateTime, ForeignKey, Enum, func
+from sqlalchemy import (
+    Integer,
+    Boolean,
+    String,
+    Date,
+    DateTime,
+    ForeignKey,
+    Enum,
+    Index,
+    func,
+)
 from sqlalchemy.orm import mapped_column, Mapped, DeclarativeBase, relationship
 from enum import StrEnum
 
@@ -31,6 +41,7 @@ class User(Base):
 
 class Contact(Base):
     __tablename__ = "contacts"
+    __table_args__ = (Index("ix_contacts_user_id_id", "user_id", "id"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     name: Mapped[str] = mapped_column(String(50), nullable=False)
@@ -0,0 +1,20 @@
+"""
+Shared rate limiter instance.
+
+This module exposes a single `Limiter` backed by Redis so rate-limit
+counters are shared across all uvicorn workers instead of being kept
+per-process. Falls back to in-memory storage when Redis is unreachable.
+"""
+
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+
+from src.conf.config import config
+
+#: Application-wide rate limiter, imported by `main.py` and the routers.
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=config.REDIS_URL,
+    strategy="moving-window",
+    in_memory_fallback_enabled=True,
+)
@@ -1,10 +1,21 @@
 from typing import List
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import Contact, User
-from src.schemas import ContactBase
+from src.schemas import ContactBase, ContactUpdate
+
+#: Paginated per-user listing built once at import time; the ordered
+#: (user_id, id) filter matches the ix_contacts_user_id_id index. The
+#: window count returns the total matching rows in the same round-trip.
+_STMT_CONTACTS_BY_USER = (
+    select(Contact, func.count().over().label("total"))
+    .where(Contact.user_id == bindparam("uid"))
+    .order_by(Contact.id)
+    .limit(bindparam("lim"))
+    .offset(bindparam("off"))
+)
 
 
 class ContactRepository:
@@ -49,13 +60,18 @@ class ContactRepository:
         :return: The contact if found, otherwise None.
         :rtype: Contact | None
         """
-        query = select(Contact).filter_by(id=contact_id, user=user)
+        query = select(Contact).filter_by(id=contact_id, user_id=user.id)
         contact = await self.db.execute(query)
         return contact.scalar_one_or_none()
 
-    async def get_contacts(self, skip: int, limit: int, user: User) -> List[Contact]:
+    async def get_contacts(
+        self, skip: int, limit: int, user: User
+    ) -> tuple[List[Contact], int]:
         """
-        Retrieve a list of contacts for a given user with pagination.
+        Retrieve a page of contacts for a given user plus the total count.
+
+        The count is produced by a window function inside the same query,
+        so pagination metadata costs no extra round-trip.
 
         :param skip: Number of records to skip.
         :type skip: int
@@ -63,38 +79,48 @@ class ContactRepository:
         :type limit: int
         :param user: The user whose contacts are retrieved.
         :type user: User
-        :return: List of contacts.
-        :rtype: List[Contact]
+        :return: Tuple of (contacts page, total matching contacts).
+        :rtype: tuple[List[Contact], int]
         """
-        query = select(Contact).filter_by(user=user).offset(skip).limit(limit)
-        contacts = await self.db.execute(query)
-        return contacts.scalars().all()
+        result = await self.db.execute(
+            _STMT_CONTACTS_BY_USER, {"uid": user.id, "lim": limit, "off": skip}
+        )
+        rows = result.all()
+        contacts = [row.Contact for row in rows]
+        total = rows[0].total if rows else 0
+        return contacts, total
 
     async def update_contact(
-        self, contact_id: int, body: ContactBase, user: User
+        self, contact_id: int, body: ContactUpdate, user: User
     ) -> Contact | None:
         """
         Update an existing contact for a given user.
 
+        Only the fields actually supplied by the client are written, so a
+        partial payload never overwrites the remaining columns.
+
         :param contact_id: ID of the contact to update.
         :type contact_id: int
-        :param body: Updated contact data.
-        :type body: ContactBase
+        :param body: Updated contact data (unset fields are left untouched).
+        :type body: ContactUpdate
         :param user: The user who owns the contact.
         :type user: User
         :return: The updated contact or None if not found.
         :rtype: Contact | None
         """
-        contact = await self.get_contact_by_id(contact_id, user)
-        if contact:
-            contact.name = body.name
-            contact.surname = body.surname
-            contact.birthday = body.birthday
-            contact.email = body.email
-            contact.phone = body.phone
-            contact.extra_info = body.extra_info
-            await self.db.commit()
-            await self.db.refresh(contact)
+        values = body.model_dump(exclude_unset=True)
+        if not values:
+            return await self.get_contact_by_id(contact_id, user)
+        stmt = (
+            update(Contact)
+            .where(Contact.id == contact_id, Contact.user_id == user.id)
+            .values(**values)
+            .returning(Contact)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db.execute(stmt)
+        contact = result.scalar_one_or_none()
+        await self.db.commit()
         return contact
 
     async def remove_contact(self, contact_id: int, user: User) -> Contact | None:
@@ -108,10 +134,15 @@ class ContactRepository:
         :return: The removed contact or None if not found.
         :rtype: Contact | None
         """
-        contact = await self.get_contact_by_id(contact_id, user)
-        if contact:
-            await self.db.delete(contact)
-            await self.db.commit()
+        stmt = (
+            delete(Contact)
+            .where(Contact.id == contact_id, Contact.user_id == user.id)
+            .returning(Contact)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db.execute(stmt)
+        contact = result.scalar_one_or_none()
+        await self.db.commit()
         return contact
 
     async def get_contacts_by_ids(
@@ -8,12 +8,17 @@ Classes:
     UserRepository: Handles database interactions for user-related operations.
 """
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database.models import User
+from src.database.models import User, UserRole
 from src.schemas import UserCreate
 
+#: Statements built once at import time so the auth hot path reuses the
+#: same compiled construct instead of rebuilding a select() per request.
+_STMT_USER_BY_USERNAME = select(User).where(User.username == bindparam("u"))
+_STMT_USER_BY_EMAIL = select(User).where(User.email == bindparam("u"))
+
 
 class UserRepository:
     """
@@ -35,12 +40,13 @@ class UserRepository:
         """
         Retrieve a user by their ID.
 
+        Uses `Session.get` so an already-loaded user is served from the
+        identity map without emitting SQL.
+
         :param user_id: The ID of the user to retrieve.
         :return: The `User` object if found, otherwise `None`.
         """
-        stmt = select(User).filter_by(id=user_id)
-        user = await self.db.execute(stmt)
-        return user.scalar_one_or_none()
+        return await self.db.get(User, user_id)
 
     async def get_user_by_username(self, username: str) -> User | None:
         """
@@ -49,8 +55,7 @@ class UserRepository:
         :param username: The username of the user to retrieve.
         :return: The `User` object if found, otherwise `None`.
         """
-        stmt = select(User).filter_by(username=username)
-        user = await self.db.execute(stmt)
+        user = await self.db.execute(_STMT_USER_BY_USERNAME, {"u": username})
         return user.scalar_one_or_none()
 
     async def get_user_by_email(self, email: str) -> User | None:
@@ -60,10 +65,30 @@ class UserRepository:
         :param email: The email of the user to retrieve.
         :return: The `User` object if found, otherwise `None`.
         """
-        stmt = select(User).filter_by(email=email)
-        user = await self.db.execute(stmt)
+        user = await self.db.execute(_STMT_USER_BY_EMAIL, {"u": email})
         return user.scalar_one_or_none()
 
+    async def find_conflict(self, email: str, username: str) -> tuple[bool, bool]:
+        """
+        Check whether the given email or username is already taken.
+
+        Issues a single SELECT covering both columns instead of one
+        query per field.
+
+        :param email: The email to check for.
+        :param username: The username to check for.
+        :return: Tuple of (email_exists, username_exists).
+        """
+        result = await self.db.execute(
+            select(User.email, User.username)
+            .where(or_(User.email == email, User.username == username))
+            .limit(2)
+        )
+        rows = result.all()
+        email_exists = any(row.email == email for row in rows)
+        username_exists = any(row.username == username for row in rows)
+        return email_exists, username_exists
+
     async def create_user(self, body: UserCreate, avatar: str = None) -> User:
         """
         Create a new user in the database.
@@ -82,28 +107,46 @@ class UserRepository:
         await self.db.refresh(user)
         return user
 
-    async def confirmed_email(self, email: str) -> None:
+    async def confirmed_email(self, email: str) -> str | None:
         """
         Mark a user's email as confirmed.
 
         :param email: The email of the user to confirm.
+        :return: The username of the confirmed user, or `None` if not found.
         """
-        user = await self.get_user_by_email(email)
-        user.confirmed = True
+        result = await self.db.execute(
+            update(User)
+            .where(User.email == email)
+            .values(confirmed=True)
+            .returning(User.username)
+        )
+        username = result.scalar_one_or_none()
         await self.db.commit()
+        return username
 
-    async def update_avatar_url(self, email: str, url: str) -> User:
+    async def update_avatar_url(self, email: str, url: str) -> User | None:
         """
-        Update the avatar URL for a specific user.
+        Update the avatar URL for an admin user.
+
+        The admin check rides along in the WHERE clause, so the common
+        case is a single UPDATE ... RETURNING round trip. A `None`
+        result means no admin row matched; callers that need to tell a
+        missing user from a non-admin one can follow up with a SELECT.
 
         :param email: The email of the user to update.
         :param url: The new avatar URL.
-        :return: The updated `User` object.
-        """
-        user = await self.get_user_by_email(email)
-        user.avatar = url
+        :return: The updated `User` object, or `None` if no admin user
+            with that email exists.
+        """
+        stmt = (
+            update(User)
+            .where(User.email == email, User.role == UserRole.ADMIN)
+            .values(avatar=url)
+            .returning(User)
+        )
+        result = await self.db.execute(stmt)
+        user = result.scalar_one_or_none()
         await self.db.commit()
-        await self.db.refresh(user)
         return user
 
     async def update_password(self, user, hashed_password: str):
@@ -43,6 +43,13 @@ class User(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class UserPrincipal(BaseModel):
+    """Lightweight authenticated principal decoded straight from a JWT."""
+
+    id: int
+    role: UserRole
+
+
 class UserCreate(BaseModel):
     username: str
     email: str
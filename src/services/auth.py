@@ -1,37 +1,84 @@
 """
 Authentication and token service.
 
-This module provides utilities for password hashing, JWT token creation and validation,
-and retrieving the current user from a token.
-
-Classes:
-    Hash: Handles password hashing and verification.
+This module provides utilities for JWT token creation and validation,
+and retrieving the current user from a token. Password hashing lives in
+`src.utils.hash_utility`.
 
 Functions:
     create_access_token: Create a JWT access token.
     get_current_user: Retrieve the current user from a JWT token.
+    get_current_user_light: Resolve a lightweight principal from a JWT.
     create_email_token: Create a JWT token for email verification.
     get_email_from_token: Extract email from a JWT token.
 """
 
-from datetime import datetime, timedelta, UTC
+import hashlib
+import json
+import time
 from typing import Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
-from jose import JWTError, jwt
+import jwt
+from jwt import PyJWTError
 from redis.asyncio import Redis
 
 
 from src.database.db import get_db, get_redis
 from src.conf.config import config
-from src.services.users import UserService
-from src.schemas import User
+from src.repository.users import UserRepository
+from src.schemas import User, UserPrincipal
 from src.database.models import UserRole
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+#: Encode/decode and config values bound once at import time so the hot
+#: path skips the module attribute lookup per request.
+_jwt_encode = jwt.encode
+_jwt_decode = jwt.decode
+_JWT_SECRET = config.JWT_SECRET
+_JWT_ALGORITHM = config.JWT_ALGORITHM
+
+#: In-process cache of decoded JWT payloads keyed by sha256(token).
+#: Skips the HMAC verification for tokens seen within the last TTL window.
+_JWT_CACHE_TTL = 60
+_JWT_CACHE_INVALID_TTL = 5
+_JWT_CACHE_MAXSIZE = 10000
+_JWT_INVALID = object()
+_jwt_cache: dict[bytes, tuple[object, float]] = {}
+
+
+def _jwt_cache_get(key: bytes):
+    """
+    Return a cached JWT payload if present and not expired, otherwise None.
+
+    :param key: sha256 digest of the raw token.
+    :return: The cached payload, the invalid-token sentinel, or None.
+    """
+    entry = _jwt_cache.get(key)
+    if entry is None:
+        return None
+    value, expires_at = entry
+    if expires_at <= time.time():
+        _jwt_cache.pop(key, None)
+        return None
+    return value
+
+
+def _jwt_cache_set(key: bytes, value, ttl: float) -> None:
+    """
+    Store a decoded payload (or the invalid sentinel) in the JWT cache.
+
+    :param key: sha256 digest of the raw token.
+    :param value: Decoded payload dict or the invalid-token sentinel.
+    :param ttl: Cache lifetime in seconds.
+    """
+    if len(_jwt_cache) >= _JWT_CACHE_MAXSIZE:
+        _jwt_cache.clear()
+    _jwt_cache[key] = (value, time.time() + ttl)
+
 
 async def create_access_token(data: dict, expires_delta: Optional[int] = None) -> str:
     """
@@ -41,16 +88,41 @@ async def create_access_token(data: dict, expires_delta: Optional[int] = None) -
     :param expires_delta: Optional expiration time in seconds.
     :return: Encoded JWT token as a string.
     """
-    to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.now(UTC) + timedelta(seconds=expires_delta)
-    else:
-        expire = datetime.now(UTC) + timedelta(seconds=config.JWT_EXPIRATION_SECONDS)
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(
-        to_encode, config.JWT_SECRET, algorithm=config.JWT_ALGORITHM
+    # Integer epoch seconds go straight into the claim — jwt.encode
+    # would only convert a datetime back to this anyway. The dict
+    # literal copies and merges in one allocation.
+    exp = int(time.time()) + (expires_delta or config.JWT_EXPIRATION_SECONDS)
+    return _jwt_encode({**data, "exp": exp}, _JWT_SECRET, algorithm=_JWT_ALGORITHM)
+
+
+def _decode_access_token(token: str) -> dict:
+    """
+    Decode a JWT access token through the in-process payload cache.
+
+    :param token: Raw bearer token from the request.
+    :raises HTTPException: 401 if the token is invalid or expired.
+    :return: The decoded token payload.
+    """
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
     )
-    return encoded_jwt
+
+    cache_key = hashlib.sha256(token.encode()).digest()
+    payload = _jwt_cache_get(cache_key)
+    if payload is None:
+        try:
+            payload = _jwt_decode(token, _JWT_SECRET, algorithms=[_JWT_ALGORITHM])
+            ttl = min(_JWT_CACHE_TTL, payload.get("exp", 0) - time.time())
+            if ttl > 0:
+                _jwt_cache_set(cache_key, payload, ttl)
+        except PyJWTError:
+            _jwt_cache_set(cache_key, _JWT_INVALID, _JWT_CACHE_INVALID_TTL)
+            raise credentials_exception
+    if payload is _JWT_INVALID:
+        raise credentials_exception
+    return payload
 
 
 async def get_current_user(
@@ -78,34 +150,78 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    try:
-        payload = jwt.decode(
-            token, config.JWT_SECRET, algorithms=[config.JWT_ALGORITHM]
-        )
-        username = payload.get("sub")
-        if username is None:
-            raise credentials_exception
-    except JWTError:
+    payload = _decode_access_token(token)
+    username = payload.get("sub")
+    if username is None:
         raise credentials_exception
 
-    cached_user = await redis.get(f"user:username:{username}")
+    cache_name = f"user:username:{username}"
+    cached_user = await redis.getex(cache_name, ex=3600)
     if cached_user:
-        return User.model_validate_json(cached_user)
+        # The cached payload was validated when it was written, so skip
+        # the Pydantic validator pass on the hot path.
+        return User.model_construct(**json.loads(cached_user))
 
-    user_service = UserService(db)
-    user = await user_service.get_user_by_username(username)
+    user = await UserRepository(db).get_user_by_username(username)
     if user is None:
         raise credentials_exception
 
+    # Build the payload directly from the ORM row: it is already trusted,
+    # so re-running Pydantic validation before serializing is wasted work.
     await redis.set(
-        f"user:username:{user.username}",
-        User.model_validate(user).model_dump_json(),
+        cache_name,
+        json.dumps(
+            {
+                "id": user.id,
+                "username": user.username,
+                "email": user.email,
+                "avatar": user.avatar,
+                "role": user.role.value,
+            }
+        ),
         ex=3600,
     )
     return user
 
 
-def get_current_admin_user(current_user: User = Depends(get_current_user)):
+async def get_current_user_light(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db),
+    redis: Redis = Depends(get_redis),
+) -> UserPrincipal:
+    """
+    Resolve a lightweight principal for read-only endpoints.
+
+    Tokens issued at login embed `uid` and `role`, so ownership filtering
+    can run on the JWT alone — no database or Redis access. Tokens
+    without the embedded claims fall back to the full user lookup.
+
+    :param token: JWT token provided in the request header.
+    :param db: Database session dependency (fallback path only).
+    :param redis: Redis client dependency (fallback path only).
+    :raises HTTPException: If the token is invalid or user does not exist.
+    :return: A `UserPrincipal` carrying the user's id and role.
+    """
+    payload = _decode_access_token(token)
+    uid = payload.get("uid")
+    role = payload.get("role")
+    if uid is None or role is None:
+        user = await get_current_user(token=token, db=db, redis=redis)
+        return UserPrincipal.model_construct(id=user.id, role=user.role)
+    return UserPrincipal.model_construct(id=uid, role=UserRole(role))
+
+
+async def get_current_admin_user(current_user: User = Depends(get_current_user)):
+    """
+    Require the current user to be an admin.
+
+    Async so FastAPI never dispatches the auth chain through its
+    threadpool executor.
+
+    :param current_user: The authenticated user from `get_current_user`.
+    :raises HTTPException: 403 if the user is not an admin.
+    :return: The authenticated admin user.
+    """
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(status_code=403, detail="Insufficient access rights")
     return current_user
@@ -118,11 +234,14 @@ def create_email_token(data: dict) -> str:
     :param data: A dictionary containing the token payload.
     :return: Encoded JWT token as a string valid for 7 days.
     """
-    to_encode = data.copy()
-    expire = datetime.now(UTC) + timedelta(days=7)
-    to_encode.update({"iat": datetime.now(UTC), "exp": expire})
-    token = jwt.encode(to_encode, config.JWT_SECRET, algorithm=config.JWT_ALGORITHM)
-    return token
+    # One clock read shared by both claims: avoids the double
+    # datetime.now() call and any iat > exp skew across the two reads.
+    now = int(time.time())
+    return _jwt_encode(
+        {**data, "iat": now, "exp": now + 7 * 86400},
+        _JWT_SECRET,
+        algorithm=_JWT_ALGORITHM,
+    )
 
 
 async def get_email_from_token(token: str) -> str:
@@ -134,12 +253,10 @@ async def get_email_from_token(token: str) -> str:
     :return: Email address extracted from the token.
     """
     try:
-        payload = jwt.decode(
-            token, config.JWT_SECRET, algorithms=[config.JWT_ALGORITHM]
-        )
+        payload = _jwt_decode(token, _JWT_SECRET, algorithms=[_JWT_ALGORITHM])
         email = payload["sub"]
         return email
-    except JWTError:
+    except PyJWTError:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail="Неправильний токен для перевірки електронної пошти",
@@ -28,10 +28,18 @@ def _handle_integrity_error(e: IntegrityError):
     Raises an HTTPException with appropriate status code and message
     depending on the type of integrity violation.
 
+    Classification prefers the driver's SQLSTATE code (23505 = unique
+    violation on Postgres) over scanning the error message, which is
+    locale-dependent free text. SQLite drivers expose no sqlstate, so
+    the constraint-name substring check remains as the fallback.
+
     :param e: The IntegrityError exception instance.
     :raises HTTPException: HTTP 409 if duplicate contact, HTTP 400 otherwise.
     """
-    if "unique_contact_user" in str(e.orig):
+    sqlstate = getattr(e.orig, "sqlstate", None)
+    if sqlstate == "23505" or (
+        sqlstate is None and "unique_contact_user" in str(e.orig)
+    ):
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Контакт з таким ім'ям вже існує.",
@@ -45,11 +53,10 @@ def _handle_integrity_error(e: IntegrityError):
 
 class ContactService:
     """
-    Service class for managing user contacts.
-
-    Provides methods to create, retrieve, update, and delete contacts,
-    handling integrity errors and delegating database operations to
-    `ContactRepository`.
+    Service class for contact operations that need business logic on top
+    of `ContactRepository` — currently integrity-error handling on
+    creation. Routes that are pure pass-throughs call the repository
+    directly and skip this layer.
 
     Args:
         db (AsyncSession): Asynchronous SQLAlchemy session for database access.
@@ -79,45 +86,3 @@ class ContactService:
         except IntegrityError as e:
             await self.repository.db.rollback()
             _handle_integrity_error(e)
-
-    async def get_contact(self, contact_id: int, user: User):
-        """
-        Retrieve a specific contact by ID for a given user.
-
-        :param contact_id: ID of the contact to retrieve.
-        :param user: User object to whom the contact belongs.
-        :return: The contact object if found, otherwise None.
-        """
-        return await self.repository.get_contact_by_id(contact_id, user)
-
-    async def get_contacts(self, skip: int, limit: int, user: User):
-        """
-        Retrieve a paginated list of contacts for a given user.
-
-        :param skip: Number of contacts to skip (offset).
-        :param limit: Maximum number of contacts to return.
-        :param user: User object to whom the contacts belong.
-        :return: List of contact objects.
-        """
-        return await self.repository.get_contacts(skip, limit, user)
-
-    async def update_contact(self, contact_id: int, body: ContactBase, user: User):
-        """
-        Update an existing contact's information.
-
-        :param contact_id: ID of the contact to update.
-        :param body: ContactBase schema instance with updated data.
-        :param user: User object to whom the contact belongs.
-        :return: The updated contact object.
-        """
-        return await self.repository.update_contact(contact_id, body, user)
-
-    async def remove_contact(self, contact_id: int, user: User):
-        """
-        Remove a contact for a given user.
-
-        :param contact_id: ID of the contact to remove.
-        :param user: User object to whom the contact belongs.
-        :return: The removed contact object.
-        """
-        return await self.repository.remove_contact(contact_id, user)
@@ -6,30 +6,85 @@ including sending verification emails with JWT tokens for email confirmation.
 
 Functions:
     send_email: Send an email with a verification token using a specified template.
+    enqueue_email: Queue an email job for the background worker.
+    email_worker: Consume queued email jobs until cancelled.
 """
 
+import asyncio
+import inspect
+from functools import lru_cache
 from pathlib import Path
 
-from fastapi_mail import FastMail, MessageSchema, ConnectionConfig, MessageType
-from fastapi_mail.errors import ConnectionErrors
 from pydantic import EmailStr
 
 from src.services.auth import create_email_token
 from src.conf.config import config
 
-conf = ConnectionConfig(
-    MAIL_USERNAME=config.MAIL_USERNAME,
-    MAIL_PASSWORD=config.MAIL_PASSWORD,
-    MAIL_FROM=config.MAIL_FROM,
-    MAIL_PORT=config.MAIL_PORT,
-    MAIL_SERVER=config.MAIL_SERVER,
-    MAIL_FROM_NAME=config.MAIL_FROM_NAME,
-    MAIL_STARTTLS=config.MAIL_STARTTLS,
-    MAIL_SSL_TLS=config.MAIL_SSL_TLS,
-    USE_CREDENTIALS=config.USE_CREDENTIALS,
-    VALIDATE_CERTS=config.VALIDATE_CERTS,
-    TEMPLATE_FOLDER=Path(__file__).parent / "templates",
-)
+
+@lru_cache(maxsize=1)
+def _mail_conf():
+    """
+    Build the FastAPI-Mail connection config on first use.
+
+    fastapi_mail pulls in jinja2 and aiosmtplib, so importing it lazily
+    keeps it off the cold-start path for processes that never send mail.
+    The first send pays the import; every later call gets the cached
+    config.
+
+    :return: The shared `ConnectionConfig` instance.
+    """
+    from fastapi_mail import ConnectionConfig
+
+    return ConnectionConfig(
+        MAIL_USERNAME=config.MAIL_USERNAME,
+        MAIL_PASSWORD=config.MAIL_PASSWORD,
+        MAIL_FROM=config.MAIL_FROM,
+        MAIL_PORT=config.MAIL_PORT,
+        MAIL_SERVER=config.MAIL_SERVER,
+        MAIL_FROM_NAME=config.MAIL_FROM_NAME,
+        MAIL_STARTTLS=config.MAIL_STARTTLS,
+        MAIL_SSL_TLS=config.MAIL_SSL_TLS,
+        USE_CREDENTIALS=config.USE_CREDENTIALS,
+        VALIDATE_CERTS=config.VALIDATE_CERTS,
+        TEMPLATE_FOLDER=Path(__file__).parent / "templates",
+    )
+
+
+#: Queue decoupling SMTP latency from the HTTP request/response cycle.
+#: Jobs are (callable, args) tuples consumed by `email_worker`.
+_email_queue: asyncio.Queue = asyncio.Queue()
+
+
+async def enqueue_email(task, *args) -> None:
+    """
+    Queue an email job to be sent by the background worker.
+
+    Returns as soon as the job is queued, so a slow SMTP server never
+    ties up the HTTP worker that handled the request.
+
+    :param task: The email coroutine function to run (e.g. `send_email`).
+    :param args: Positional arguments passed to the task.
+    """
+    await _email_queue.put((task, args))
+
+
+async def email_worker() -> None:
+    """
+    Consume queued email jobs until cancelled.
+
+    Started once per process from the application lifespan; failures are
+    logged and do not stop the worker.
+    """
+    while True:
+        task, args = await _email_queue.get()
+        try:
+            result = task(*args)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as err:
+            print(err)
+        finally:
+            _email_queue.task_done()
 
 
 async def send_email(email: EmailStr, username: str, host: str):
@@ -44,6 +99,9 @@ async def send_email(email: EmailStr, username: str, host: str):
     :param host: The host URL to include in the verification link.
     :raises ConnectionErrors: If there is a failure connecting to the mail server.
     """
+    from fastapi_mail import FastMail, MessageSchema, MessageType
+    from fastapi_mail.errors import ConnectionErrors
+
     try:
         token_verification = create_email_token({"sub": email})
         message = MessageSchema(
@@ -57,7 +115,7 @@ async def send_email(email: EmailStr, username: str, host: str):
             subtype=MessageType.html,
         )
 
-        fm = FastMail(conf)
+        fm = FastMail(_mail_conf())
         await fm.send_message(message, template_name="verify_email.html")
     except ConnectionErrors as err:
         print(err)
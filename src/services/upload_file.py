@@ -5,40 +5,47 @@ This module provides the `UploadFileService` class for uploading files
 (e.g., avatars) to Cloudinary and generating optimized URLs.
 
 Classes:
-    UploadFileService: Handles file uploads and avatar URL updates.
+    UploadFileService: Handles file uploads to Cloudinary.
+
+Attributes:
+    upload_file_service: Shared service instance configured at import time.
 """
 
-import cloudinary
-import cloudinary.uploader
+from functools import lru_cache
 
+from src.conf.config import config
 
-class UploadFileService:
+
+@lru_cache(maxsize=1)
+def _cloudinary():
     """
-    Service class for uploading files to Cloudinary and managing user avatars.
+    Import and configure Cloudinary on first use.
 
-    Args:
-        cloud_name (str): Cloudinary cloud name.
-        api_key (str): Cloudinary API key.
-        api_secret (str): Cloudinary API secret.
+    The cloudinary package drags in requests/urllib3, so importing it
+    lazily keeps it off the cold-start path for processes that never
+    handle an upload. Cloudinary's config is process-global module
+    state; lru_cache guarantees it is set exactly once.
+
+    :return: The configured `cloudinary` module.
     """
+    import cloudinary
+    import cloudinary.uploader
 
-    def __init__(self, cloud_name: str, api_key: str, api_secret: str):
-        """
-        Initialize the UploadFileService with Cloudinary credentials.
+    cloudinary.config(
+        cloud_name=config.CLD_NAME,
+        api_key=config.CLD_API_KEY,
+        api_secret=config.CLD_API_SECRET,
+        secure=True,
+    )
+    return cloudinary
 
-        :param cloud_name: Cloudinary cloud name.
-        :param api_key: Cloudinary API key.
-        :param api_secret: Cloudinary API secret.
-        """
-        self.cloud_name = cloud_name
-        self.api_key = api_key
-        self.api_secret = api_secret
-        cloudinary.config(
-            cloud_name=self.cloud_name,
-            api_key=self.api_key,
-            api_secret=self.api_secret,
-            secure=True,
-        )
+
+class UploadFileService:
+    """
+    Service class for uploading files to Cloudinary and managing user avatars.
+
+    Stateless: credentials live in the module-level Cloudinary config.
+    """
 
     @staticmethod
     def upload_file(file, username: str) -> str:
@@ -52,6 +59,7 @@ class UploadFileService:
         :param username: The username to include in the public Cloudinary ID.
         :return: URL of the uploaded and resized file.
         """
+        cloudinary = _cloudinary()
         public_id = f"RestApp/{username}"
         r = cloudinary.uploader.upload(file.file, public_id=public_id, overwrite=True)
         src_url = cloudinary.CloudinaryImage(public_id).build_url(
@@ -59,12 +67,7 @@ class UploadFileService:
         )
         return src_url
 
-    async def update_avatar_url(self, email: str, url: str):
-        """
-        Update the avatar URL for a user.
 
-        :param email: The email of the user.
-        :param url: The new avatar URL.
-        :return: Result of the repository update operation.
-        """
-        return await self.repository.update_avatar_url(email, url)
+#: Shared instance so the Cloudinary client (and its keep-alive TLS
+#: session) is reused across requests instead of rebuilt per upload.
+upload_file_service = UploadFileService()
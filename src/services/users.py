@@ -6,15 +6,36 @@ business logic, including user creation, retrieval, and email confirmation.
 
 Classes:
     UserService: Provides high-level operations for user management.
+
+Functions:
+    gravatar_url: Build the Gravatar URL for an email address.
 """
 
+import hashlib
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from libgravatar import Gravatar
 from fastapi import HTTPException
+from redis.asyncio import Redis
+
 from src.repository.users import UserRepository
-from src.schemas import UserCreate, UserRole
-from src.utils.hash_utility import Hash
+from src.schemas import User as UserSchema
+from src.schemas import UserCreate
+from src.utils.hash_utility import clear_verify_cache, hasher
+
+
+def gravatar_url(email: str) -> str:
+    """
+    Build the Gravatar URL for an email address.
+
+    Pure MD5 hashing plus string formatting — no client object or
+    network access involved.
+
+    :param email: The email address to derive the avatar from.
+    :return: The Gravatar image URL.
+    """
+    digest = hashlib.md5(email.strip().lower().encode()).hexdigest()
+    return f"https://www.gravatar.com/avatar/{digest}"
 
 
 class UserService:
@@ -26,51 +47,40 @@ class UserService:
 
     Args:
         db (AsyncSession): Asynchronous SQLAlchemy session for database access.
+        redis (Redis | None): Optional Redis client used to keep the
+            `user:username:{username}` cache in sync on mutations.
     """
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, redis: Redis | None = None):
         """
         Initialize the UserService with a database session.
 
         :param db: Asynchronous SQLAlchemy session.
+        :param redis: Optional Redis client for cache invalidation.
         """
         self.repository = UserRepository(db)
+        self.redis = redis
 
     async def create_user(self, body: UserCreate):
         """
-        Create a new user with an optional Gravatar avatar.
+        Create a new user with a Gravatar avatar.
 
-        Attempts to generate an avatar URL from the user's email using Gravatar.
+        The avatar URL is derived from the user's email address.
 
         :param body: UserCreate schema instance containing user data.
         :return: The created `User` object.
         """
-        avatar = None
-        try:
-            g = Gravatar(body.email)
-            avatar = g.get_image()
-        except Exception as e:
-            print(e)
-
-        return await self.repository.create_user(body, avatar)
-
-    async def get_user_by_id(self, user_id: int):
-        """
-        Retrieve a user by their ID.
-
-        :param user_id: The ID of the user to retrieve.
-        :return: The `User` object if found, otherwise `None`.
-        """
-        return await self.repository.get_user_by_id(user_id)
+        return await self.repository.create_user(body, gravatar_url(body.email))
 
-    async def get_user_by_username(self, username: str):
+    async def find_conflict(self, email: str, username: str):
         """
-        Retrieve a user by their username.
+        Check whether the email or username is already registered.
 
-        :param username: The username of the user to retrieve.
-        :return: The `User` object if found, otherwise `None`.
+        :param email: The email to check for.
+        :param username: The username to check for.
+        :return: Tuple of (email_exists, username_exists).
         """
-        return await self.repository.get_user_by_username(username)
+        return await self.repository.find_conflict(email, username)
 
     async def get_user_by_email(self, email: str):
         """
@@ -85,33 +95,53 @@ class UserService:
         """
         Mark a user's email as confirmed.
 
+        Also drops the cached user entry from Redis so the confirmed flag
+        is visible on the next authenticated request.
+
         :param email: The email of the user to confirm.
         :return: None
         """
-        return await self.repository.confirmed_email(email)
+        username = await self.repository.confirmed_email(email)
+        if self.redis is not None and username:
+            await self.redis.delete(f"user:username:{username}")
 
     async def update_avatar_url(self, email: str, url: str):
         """
         Update the avatar URL of a user.
 
-        This method delegates the update operation to the repository layer.
+        The repository folds the admin check into the UPDATE itself, so
+        the happy path is one round trip instead of SELECT-then-UPDATE.
+        The extra SELECT only runs on the error path to pick the right
+        status code.
 
         :param email: The email of the user whose avatar will be updated.
         :param url: The new avatar URL to set for the user.
+        :raises HTTPException: 404 if no such user, 403 if not an admin.
         :return: The updated `User` object with the new avatar URL.
         """
-        user = await self.repository.get_user_by_email(email)
-        if user.role != UserRole.ADMIN:
+        updated_user = await self.repository.update_avatar_url(email, url)
+        if updated_user is None:
+            user = await self.repository.get_user_by_email(email)
+            if user is None:
+                raise HTTPException(status_code=404, detail="User not found")
             raise HTTPException(
                 status_code=403, detail="Only admins can change their avatar"
             )
-        user.avatar = url
-        return await self.repository.update_avatar_url(email, url)
+        if self.redis is not None:
+            await self.redis.set(
+                f"user:username:{updated_user.username}",
+                UserSchema.model_validate(updated_user).model_dump_json(),
+                ex=3600,
+            )
+        return updated_user
 
     async def reset_password(self, email: str, new_password: str):
         """
         Reset a user's password.
 
+        Also drops the cached user entry from Redis so a session stolen
+        before the reset cannot keep riding the cached copy.
+
         :param email: The email of the user who requested the reset.
         :param new_password: New plain password to hash and save.
         :return: Updated User object or None if not found.
@@ -120,5 +150,9 @@ class UserService:
         if not user:
             return None
 
-        hashed_password = Hash().get_password_hash(new_password)
-        return await self.repository.update_password(user, hashed_password)
+        hashed_password = await hasher.get_password_hash(new_password)
+        updated_user = await self.repository.update_password(user, hashed_password)
+        clear_verify_cache()
+        if self.redis is not None:
+            await self.redis.delete(f"user:username:{updated_user.username}")
+        return updated_user
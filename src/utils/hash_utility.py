@@ -1,28 +1,97 @@
-from passlib.context import CryptContext
+import asyncio
+import hashlib
+import hmac
+import os
+
+import bcrypt
+
+from src.conf.config import config
+
+#: Process-local secret for deriving verify-cache keys, so neither the
+#: plaintext password nor anything reversible to it is ever stored.
+_VERIFY_CACHE_SECRET = os.urandom(32)
+_VERIFY_CACHE_MAXSIZE = 1024
+_verify_cache: dict[bytes, bool] = {}
+
+
+def _verify_cache_key(plain_password: str, hashed_password: str) -> bytes:
+    """
+    Derive the cache key for a (password, hash) pair.
+
+    :param plain_password: The plain text password being verified.
+    :param hashed_password: The stored bcrypt hash.
+    :return: HMAC-SHA256 digest over both values.
+    """
+    return hmac.new(
+        _VERIFY_CACHE_SECRET,
+        plain_password.encode() + hashed_password.encode(),
+        hashlib.sha256,
+    ).digest()
+
+
+def clear_verify_cache() -> None:
+    """
+    Drop all cached verification results, e.g. after a password reset.
+    """
+    _verify_cache.clear()
 
 
 class Hash:
     """
     Utility class for password hashing and verification using bcrypt.
-    """
 
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    Calls the native bcrypt bindings directly, skipping passlib's
+    scheme-registry dispatch and per-call hash re-parsing. Existing
+    passlib-produced ``$2b$`` hashes verify unchanged. The work factor
+    is taken from ``config.BCRYPT_COST`` so it can be tuned per
+    environment without code changes.
+    """
 
-    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """
         Verify a plain password against a hashed password.
 
+        Runs the bcrypt comparison in a worker thread so the event loop
+        is not blocked for the duration of the hash rounds.
+
+        Results are memoized under an HMAC of the (password, hash) pair,
+        so clients that re-send the same credentials in a burst pay a
+        dict lookup instead of the full bcrypt rounds.
+
         :param plain_password: The plain text password to verify.
         :param hashed_password: The hashed password for comparison.
         :return: True if the password matches, False otherwise.
         """
-        return self.pwd_context.verify(plain_password, hashed_password)
+        key = _verify_cache_key(plain_password, hashed_password)
+        cached = _verify_cache.get(key)
+        if cached is not None:
+            return cached
+        result = await asyncio.to_thread(
+            bcrypt.checkpw, plain_password.encode(), hashed_password.encode()
+        )
+        if len(_verify_cache) >= _VERIFY_CACHE_MAXSIZE:
+            _verify_cache.clear()
+        _verify_cache[key] = result
+        return result
 
-    def get_password_hash(self, password: str) -> str:
+    async def get_password_hash(self, password: str) -> str:
         """
         Hash a plain password.
 
+        Runs bcrypt in a worker thread so the event loop is not blocked
+        for the duration of the hash rounds.
+
         :param password: The plain text password to hash.
         :return: The hashed password.
         """
-        return self.pwd_context.hash(password)
+
+        def _hash() -> str:
+            salt = bcrypt.gensalt(rounds=config.BCRYPT_COST)
+            return bcrypt.hashpw(password.encode(), salt).decode()
+
+        return await asyncio.to_thread(_hash)
+
+
+#: Shared instance so call sites skip per-call construction and scheme
+#: registry dispatch on the auth hot path.
+hasher = Hash()
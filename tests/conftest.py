@@ -1,23 +1,42 @@
 import asyncio
+import os
+
+# Minimum legal bcrypt work factor: the hash is recomputed per test
+# module and the default cost adds 50-200ms per call. Must be set
+# before any src import pulls in the settings.
+os.environ.setdefault("BCRYPT_COST", "4")
+
 import pytest
-import pytest_asyncio
+import uvloop
 from fastapi.testclient import TestClient
-from sqlalchemy.pool import StaticPool
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from unittest.mock import AsyncMock, MagicMock
 
 from main import app
 from src.database.models import Base, User, UserRole
 from src.database.db import get_db, get_redis
+from src.repository.contacts import ContactRepository
+from src.repository.users import UserRepository
 from src.services.auth import create_access_token
-from src.utils.hash_utility import Hash
-
-SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
-
+from src.utils.hash_utility import hasher
+
+# Per-worker database file so `pytest -n auto` (pytest-xdist) workers
+# don't fight over one SQLite file; single-process runs keep ./test.db.
+# addopts pins --dist loadfile, keeping each module's order-dependent
+# tests on a single worker.
+_XDIST_WORKER = os.getenv("PYTEST_XDIST_WORKER", "")
+SQLALCHEMY_DATABASE_URL = f"sqlite+aiosqlite:///./test{_XDIST_WORKER}.db"
+
+# A small queue pool instead of StaticPool: the database is a file, so
+# concurrent tasks get their own connections rather than serializing on
+# a single shared one.
 engine = create_async_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=5,
+    max_overflow=0,
 )
 
 TestingSessionLocal = async_sessionmaker(
@@ -32,14 +51,14 @@ test_user = {
 }
 
 
-@pytest.fixture(scope="module", autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 def init_models_wrap():
     async def init_models():
         async with engine.begin() as conn:
             await conn.run_sync(Base.metadata.drop_all)
             await conn.run_sync(Base.metadata.create_all)
         async with TestingSessionLocal() as session:
-            hash_password = Hash().get_password_hash(test_user["password"])
+            hash_password = await hasher.get_password_hash(test_user["password"])
             current_user = User(
                 username=test_user["username"],
                 email=test_user["email"],
@@ -71,6 +90,8 @@ def client():
     redis_mock = MagicMock()
     redis_mock.get = AsyncMock(return_value=None)  # default cache miss
     redis_mock.set = AsyncMock(return_value=True)  # pretend success
+    redis_mock.delete = AsyncMock(return_value=1)
+    redis_mock.getex = AsyncMock(return_value=None)  # default cache miss
 
     async def override_get_redis():
         return redis_mock
@@ -80,7 +101,81 @@ def client():
     yield TestClient(app)
 
 
-@pytest_asyncio.fixture()
-async def get_token():
-    token = await create_access_token(data={"sub": test_user["username"]})
-    return token
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    # uvloop builds loops faster than the default selector policy, which
+    # matters when pytest-asyncio spins one up per async test.
+    return uvloop.EventLoopPolicy()
+
+
+# --- shared repository-test fixtures ---
+# Module-scoped: build the session mock once per module and wipe call
+# history between tests instead of rebuilding. The spec is the short
+# list of methods the repositories actually call — spec=AsyncSession
+# would walk the class's whole attribute surface on construction.
+
+_SESSION_METHODS = ["execute", "add", "commit", "refresh", "delete", "get"]
+
+
+class FakeResult:
+    """
+    Minimal stand-in for a SQLAlchemy Result.
+
+    A plain class with the two accessors the repositories call — no
+    MagicMock attribute autocreation per lookup.
+    """
+
+    def __init__(self, scalar=None, rows=None):
+        self._scalar = scalar
+        self._rows = rows if rows is not None else []
+
+    def scalar_one_or_none(self):
+        return self._scalar
+
+    def scalar_one(self):
+        return self._scalar
+
+    def all(self):
+        return self._rows
+
+
+@pytest.fixture(scope="module")
+def mock_session():
+    # Session.add is synchronous; everything else is awaited.
+    session = MagicMock(spec=_SESSION_METHODS)
+    for name in ("execute", "commit", "refresh", "delete", "get"):
+        setattr(session, name, AsyncMock())
+    return session
+
+
+@pytest.fixture(autouse=True)
+def _reset_mock_session(mock_session):
+    mock_session.reset_mock(return_value=False, side_effect=False)
+
+
+@pytest.fixture(scope="module")
+def user_repository(mock_session):
+    return UserRepository(mock_session)
+
+
+@pytest.fixture(scope="module")
+def contact_repository(mock_session):
+    return ContactRepository(mock_session)
+
+
+@pytest.fixture(scope="module")
+def user():
+    return User(
+        id=1,
+        username="testuser",
+        email="test@example.com",
+        hashed_password="hashed",
+        role=UserRole.ADMIN,
+    )
+
+
+@pytest.fixture(scope="module")
+def get_token():
+    # One token per module is plenty: tokens stay valid far longer than
+    # a test run, so there is no need to sign a fresh one per test.
+    return asyncio.run(create_access_token(data={"sub": test_user["username"]}))
@@ -1,48 +1,53 @@
 import pytest
-from unittest.mock import AsyncMock, MagicMock
-from sqlalchemy.ext.asyncio import AsyncSession
+from unittest.mock import ANY, MagicMock, call
 
-from src.database.models import Contact, User
-from src.repository.contacts import ContactRepository
+from conftest import FakeResult
+from src.database.models import Contact
 from src.schemas import ContactBase
 
+# Every test here is async; one module mark beats per-test decorators.
+pytestmark = pytest.mark.asyncio
+
+# Built once at module scope: the inputs are constant and Pydantic
+# validation (email/date coercion) is not free per construction.
+_CONTACT_BODY = ContactBase(
+    name="new contact",
+    surname="test",
+    email="test@example.com",
+    phone="1234567890",
+    birthday="2000-01-01",
+)
+_CONTACT_UPDATE_BODY = ContactBase(
+    name="updated contact",
+    surname="test",
+    email="test@example.com",
+    phone="1234567890",
+    birthday="2000-01-01",
+)
+
+# Canonical ORM rows, built once: Contact() runs SQLAlchemy's
+# instrumented attribute setters, which is wasted work per test when
+# the instance never changes.
+_TEST_CONTACT = Contact(id=1, name="test contact")
+_UPDATED_CONTACT = Contact(id=1, name="updated contact")
+_DELETED_CONTACT = Contact(id=1, name="contact to delete")
 
-@pytest.fixture
-def mock_session():
-    return AsyncMock(spec=AsyncSession)
 
-
-@pytest.fixture
-def contact_repository(mock_session):
-    return ContactRepository(mock_session)
-
-
-@pytest.fixture
-def user():
-    return User(id=1, username="testuser")
-
-
-@pytest.mark.asyncio
 async def test_get_contacts(contact_repository, mock_session, user):
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [
-        Contact(id=1, name="test contact", user=user)
-    ]
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    row = MagicMock()
+    row.Contact = _TEST_CONTACT
+    row.total = 1
+    mock_session.execute.return_value = FakeResult(rows=[row])
 
-    contacts = await contact_repository.get_contacts(skip=0, limit=10, user=user)
+    contacts, total = await contact_repository.get_contacts(skip=0, limit=10, user=user)
 
+    assert total == 1
     assert len(contacts) == 1
     assert contacts[0].name == "test contact"
 
 
-@pytest.mark.asyncio
 async def test_get_contact_by_id(contact_repository, mock_session, user):
-    expected_contact = Contact(id=1, name="test contact", user=user)
-
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = expected_contact
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute.return_value = FakeResult(scalar=_TEST_CONTACT)
 
     contact = await contact_repository.get_contact_by_id(contact_id=1, user=user)
 
@@ -51,59 +56,36 @@ async def test_get_contact_by_id(contact_repository, mock_session, user):
     assert contact.name == "test contact"
 
 
-@pytest.mark.asyncio
 async def test_create_contact(contact_repository, mock_session, user):
-    contact_data = ContactBase(
-        name="new contact",
-        surname="test",
-        email="test@example.com",
-        phone="1234567890",
-        birthday="2000-01-01",
-    )
-
-    result = await contact_repository.create_contact(body=contact_data, user=user)
+    result = await contact_repository.create_contact(body=_CONTACT_BODY, user=user)
 
     assert isinstance(result, Contact)
     assert result.name == "new contact"
-    mock_session.add.assert_called_once()
-    mock_session.commit.assert_awaited_once()
-    mock_session.refresh.assert_awaited_once_with(result)
+    # One list compare checks presence, arguments and ordering at once.
+    assert mock_session.mock_calls == [
+        call.add(result),
+        call.commit(),
+        call.refresh(result),
+    ]
 
 
-@pytest.mark.asyncio
 async def test_update_contact(contact_repository, mock_session, user):
-    contact_data = ContactBase(
-        name="updated contact",
-        surname="test",
-        email="test@example.com",
-        phone="1234567890",
-        birthday="2000-01-01",
-    )
-    existing_contact = Contact(id=1, name="old contact", user=user)
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = existing_contact
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute.return_value = FakeResult(scalar=_UPDATED_CONTACT)
 
     result = await contact_repository.update_contact(
-        contact_id=1, body=contact_data, user=user
+        contact_id=1, body=_CONTACT_UPDATE_BODY, user=user
     )
 
     assert result is not None
     assert result.name == "updated contact"
-    mock_session.commit.assert_awaited_once()
-    mock_session.refresh.assert_awaited_once_with(existing_contact)
+    assert mock_session.mock_calls == [call.execute(ANY), call.commit()]
 
 
-@pytest.mark.asyncio
 async def test_remove_contact(contact_repository, mock_session, user):
-    existing_contact = Contact(id=1, name="contact to delete", user=user)
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = existing_contact
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute.return_value = FakeResult(scalar=_DELETED_CONTACT)
 
     result = await contact_repository.remove_contact(contact_id=1, user=user)
 
     assert result is not None
     assert result.name == "contact to delete"
-    mock_session.delete.assert_awaited_once_with(existing_contact)
-    mock_session.commit.assert_awaited_once()
+    assert mock_session.mock_calls == [call.execute(ANY), call.commit()]
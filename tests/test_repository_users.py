@@ -1,122 +1,78 @@
 import pytest
-from unittest.mock import AsyncMock, MagicMock
-from sqlalchemy.ext.asyncio import AsyncSession
+from unittest.mock import ANY, call
 
+from conftest import FakeResult
 from src.database.models import User, UserRole
-from src.repository.users import UserRepository
 from src.schemas import UserCreate
 
-
-@pytest.fixture
-def mock_session():
-    return AsyncMock(spec=AsyncSession)
-
-
-@pytest.fixture
-def user_repository(mock_session):
-    return UserRepository(mock_session)
-
-
-@pytest.fixture
-def user():
-    return User(
-        id=1,
-        username="testuser",
-        email="test@example.com",
-        hashed_password="hashed",
-        role=UserRole.ADMIN,
-    )
-
-
-# ---------------------- get_user_by_id ----------------------
-@pytest.mark.asyncio
-async def test_get_user_by_id(user_repository, mock_session, user):
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = user
-    mock_session.execute = AsyncMock(return_value=mock_result)
-
-    result = await user_repository.get_user_by_id(user_id=1)
+# Every test here is async; one module mark beats per-test decorators.
+pytestmark = pytest.mark.asyncio
+
+# Built once at module scope: the inputs are constant and Pydantic
+# validation (email coercion) is not free per construction.
+_USER_BODY = UserCreate(
+    username="newuser",
+    email="new@example.com",
+    password="secret123",
+    role=UserRole.ADMIN,
+)
+
+
+# ---------------------- get_user_by_* ----------------------
+@pytest.mark.parametrize(
+    "method,kwargs,attr",
+    [
+        ("get_user_by_id", {"user_id": 1}, "id"),
+        ("get_user_by_username", {"username": "testuser"}, "username"),
+        ("get_user_by_email", {"email": "test@example.com"}, "email"),
+    ],
+)
+async def test_get_user_by(user_repository, mock_session, user, method, kwargs, attr):
+    # get_user_by_id goes through session.get, the others through
+    # execute; configure both and let the method pick its path.
+    mock_session.get.return_value = user
+    mock_session.execute.return_value = FakeResult(scalar=user)
+
+    result = await getattr(user_repository, method)(**kwargs)
 
     assert result is not None
-    assert result.id == 1
-    assert result.username == "testuser"
-
-
-# ---------------------- get_user_by_username ----------------------
-@pytest.mark.asyncio
-async def test_get_user_by_username(user_repository, mock_session, user):
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = user
-    mock_session.execute = AsyncMock(return_value=mock_result)
-
-    result = await user_repository.get_user_by_username(username="testuser")
-
-    assert result is not None
-    assert result.username == "testuser"
-
-
-# ---------------------- get_user_by_email ----------------------
-@pytest.mark.asyncio
-async def test_get_user_by_email(user_repository, mock_session, user):
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = user
-    mock_session.execute = AsyncMock(return_value=mock_result)
-
-    result = await user_repository.get_user_by_email(email="test@example.com")
-
-    assert result is not None
-    assert result.email == "test@example.com"
+    assert getattr(result, attr) == next(iter(kwargs.values()))
 
 
 # ---------------------- create_user ----------------------
-@pytest.mark.asyncio
 async def test_create_user(user_repository, mock_session):
-    user_data = UserCreate(
-        username="newuser",
-        email="new@example.com",
-        password="secret123",
-        role=UserRole.ADMIN,
-    )
-
     result = await user_repository.create_user(
-        body=user_data, avatar="http://avatar.com/pic.png"
+        body=_USER_BODY, avatar="http://avatar.com/pic.png"
     )
 
     assert isinstance(result, User)
     assert result.username == "newuser"
     assert result.avatar == "http://avatar.com/pic.png"
-    mock_session.add.assert_called_once()
-    mock_session.commit.assert_awaited_once()
-    mock_session.refresh.assert_awaited_once_with(result)
+    # One list compare checks presence, arguments and ordering at once.
+    assert mock_session.mock_calls == [
+        call.add(result),
+        call.commit(),
+        call.refresh(result),
+    ]
 
 
 # ---------------------- confirmed_email ----------------------
-@pytest.mark.asyncio
-async def test_confirmed_email(user_repository, mock_session, user, monkeypatch):
-    # Patch get_user_by_email to return our user
-    async def fake_get_user_by_email(email: str):
-        return user
-
-    monkeypatch.setattr(user_repository, "get_user_by_email", fake_get_user_by_email)
+async def test_confirmed_email(user_repository, mock_session):
+    mock_session.execute.return_value = FakeResult(scalar="testuser")
 
     await user_repository.confirmed_email(email="test@example.com")
 
-    assert user.confirmed is True
-    mock_session.commit.assert_awaited_once()
+    assert mock_session.mock_calls == [call.execute(ANY), call.commit()]
 
 
 # ---------------------- update_avatar_url ----------------------
-@pytest.mark.asyncio
-async def test_update_avatar_url(user_repository, mock_session, user, monkeypatch):
-    async def fake_get_user_by_email(email: str):
-        return user
-
-    monkeypatch.setattr(user_repository, "get_user_by_email", fake_get_user_by_email)
+async def test_update_avatar_url(user_repository, mock_session, user):
+    user.avatar = "http://new.avatar"
+    mock_session.execute.return_value = FakeResult(scalar=user)
 
     result = await user_repository.update_avatar_url(
         email="test@example.com", url="http://new.avatar"
     )
 
     assert result.avatar == "http://new.avatar"
-    mock_session.commit.assert_awaited_once()
-    mock_session.refresh.assert_awaited_once_with(user)
+    assert mock_session.mock_calls == [call.execute(ANY), call.commit()]
@@ -0,0 +1,22 @@
+import inspect
+
+from src.database.db import get_db, get_redis
+from src.services.auth import (
+    get_current_admin_user,
+    get_current_user,
+    get_current_user_light,
+)
+
+
+def test_auth_dependencies_are_async():
+    # A single sync dependency makes FastAPI dispatch the whole chain
+    # through its threadpool executor, so every auth-path dependency
+    # must stay a coroutine function.
+    assert inspect.isasyncgenfunction(get_db)
+    for dep in (
+        get_redis,
+        get_current_user,
+        get_current_user_light,
+        get_current_admin_user,
+    ):
+        assert inspect.iscoroutinefunction(dep), dep.__name__